@@ -1,3 +1,76 @@
+import math
+from functools import lru_cache, wraps
+
+import numpy as np
+from numba import float64, guvectorize, njit
+
+
+# Scaling factor to normalize maneuverability output based on dataset trends
+MANEUVERABILITY_K = 1.05  # Adjust as needed based on data fit
+
+# Optimized crew-time parameters based on validation data
+CREW_TIME_SCALING = 15.01  # Adjusted to fit actual data (minutes per complexity unit)
+AUTOMATION_EFFECT = 10.41  # Exponential effect of automation
+
+# Tuning parameter to balance power usage against environmental factors
+ACCURACY_K = 50.0  # Adjust as needed for better accuracy
+
+
+# Compiled kernels for the model equations; inputs are validated by LunarLogisticsModel
+@njit(cache=True)
+def _pm(payload_mass, robot_power_output, terrain_complexity):
+    # Compute maneuverability as a function of power, mass, and terrain resistance
+    return (robot_power_output / (payload_mass * (1.0 + terrain_complexity))) * MANEUVERABILITY_K
+
+@njit(cache=True)
+def _ct(payload_complexity, system_automation_level):
+    # Calculate time with optimized scaling
+    time_with_automation = CREW_TIME_SCALING * payload_complexity * (1.0 - math.pow(system_automation_level, AUTOMATION_EFFECT))
+
+    # Float compare-and-select clamp, lowered to maxsd
+    return time_with_automation if time_with_automation > 0.0 else 0.0
+
+@njit(cache=True)
+def _pa(power_usage, environmental_noise, robot_path_variability):
+    # Calculate accuracy with improved scaling
+    accuracy = power_usage / (power_usage + ACCURACY_K * (1.0 + environmental_noise + robot_path_variability))
+
+    # Float compare-and-select clamp to [0, 1], lowered to minsd/maxsd; the compare
+    # order mirrors max(0, min(1, accuracy)), which maps NaN to 1
+    accuracy = accuracy if accuracy < 1.0 else 1.0
+    return accuracy if accuracy > 0.0 else 0.0
+
+
+# Column-wise gufuncs over the kernels above, used by the *_array methods
+@guvectorize([(float64[:], float64[:], float64[:], float64[:])], '(n),(n),(n)->(n)',
+             nopython=True, cache=True)
+def _gu_pm(payload_mass, robot_power_output, terrain_complexity, out):
+    for i in range(payload_mass.shape[0]):
+        out[i] = _pm(payload_mass[i], robot_power_output[i], terrain_complexity[i])
+
+@guvectorize([(float64[:], float64[:], float64[:])], '(n),(n)->(n)',
+             nopython=True, cache=True)
+def _gu_ct(payload_complexity, system_automation_level, out):
+    for i in range(payload_complexity.shape[0]):
+        out[i] = _ct(payload_complexity[i], system_automation_level[i])
+
+@guvectorize([(float64[:], float64[:], float64[:], float64[:])], '(n),(n),(n)->(n)',
+             nopython=True, cache=True)
+def _gu_pa(power_usage, environmental_noise, robot_path_variability, out):
+    for i in range(power_usage.shape[0]):
+        out[i] = _pa(power_usage[i], environmental_noise[i], robot_path_variability[i])
+
+def _apply_gufunc(gufunc, *arrays):
+    # Run the gufunc over the flattened elements of the common broadcast shape.
+    # Inputs already of that shape are passed as flat views; only inputs of other
+    # shapes (e.g. np.ix_ sweep axes) are copied out to the full broadcast size.
+    shape = np.broadcast_shapes(*[a.shape for a in arrays])
+    arrays = [a if a.shape == shape else np.broadcast_to(a, shape) for a in arrays]
+    # NaN inputs that pass validation propagate silently, as in the scalar kernels
+    with np.errstate(invalid='ignore'):
+        return gufunc(*[a.reshape(-1) for a in arrays]).reshape(shape)
+
+
 class LunarLogisticsModel:
     def payload_maneuverability(self, payload_mass, robot_power_output, terrain_complexity):
         """
@@ -19,13 +92,7 @@ class LunarLogisticsModel:
         if terrain_complexity < 0:
             raise ValueError("Terrain complexity cannot be negative.")
 
-        # Scaling factor to normalize output based on dataset trends
-        K = 1.05  # Adjust as needed based on data fit
-
-        # Compute maneuverability as a function of power, mass, and terrain resistance
-        travel_speed = (robot_power_output / (payload_mass * (1 + terrain_complexity))) *K
-
-        return travel_speed  # Output in m/s (not clipped)
+        return _pm(payload_mass, robot_power_output, terrain_complexity)  # Output in m/s (not clipped)
 
 
     def crew_time_requirements(self, payload_complexity, system_automation_level):
@@ -46,14 +113,7 @@ class LunarLogisticsModel:
         if not (0 <= system_automation_level <= 1):
             raise ValueError("System automation level must be between 0 and 1.")
 
-        # Optimized parameters based on validation data
-        scaling_factor = 15.01  # Adjusted to fit actual data (minutes per complexity unit)
-        automation_effect = 10.41  # Exponential effect of automation
-
-        # Calculate time with optimized scaling
-        time_with_automation = scaling_factor * payload_complexity * (1 - system_automation_level**automation_effect)
-
-        return max(0, time_with_automation)
+        return _ct(payload_complexity, system_automation_level)
 
     def position_location_accuracy(self, power_usage, environmental_noise, robot_path_variability):
         """
@@ -74,24 +134,105 @@ class LunarLogisticsModel:
         if environmental_noise < 0 or robot_path_variability < 0:
             raise ValueError("Environmental noise and robot path variability cannot be negative.")
 
-        # Tuning parameter to balance power usage against environmental factors
-        K = 50  # Adjust as needed for better accuracy
+        return _pa(power_usage, environmental_noise, robot_path_variability)
 
-        # Calculate accuracy with improved scaling
-        accuracy = power_usage / (power_usage + K * (1 + environmental_noise + robot_path_variability))
+    # Array versions of the models above, for validation sets and parameter sweeps.
+    # Inputs may be scalars or arrays of any broadcast-compatible shapes.
 
-        return max(0, min(1, accuracy))
+    def payload_maneuverability_array(self, payload_masses, robot_power_outputs, terrain_complexities):
+        """
+        Element-wise payload_maneuverability over arrays of inputs.
+
+        Output:
+        - travel_speeds (m/s): ndarray of estimated travel speeds.
+        """
+        payload_masses = np.asarray(payload_masses, dtype=np.float64)
+        robot_power_outputs = np.asarray(robot_power_outputs, dtype=np.float64)
+        terrain_complexities = np.asarray(terrain_complexities, dtype=np.float64)
+
+        # Check if inputs are valid
+        if np.any(payload_masses <= 0) or np.any(robot_power_outputs <= 0):
+            raise ValueError("Payload mass and robot power output must be positive values.")
+        if np.any(terrain_complexities < 0):
+            raise ValueError("Terrain complexity cannot be negative.")
 
+        return _apply_gufunc(_gu_pm, payload_masses, robot_power_outputs, terrain_complexities)
 
-# Export functions for easier direct import
+    def crew_time_requirements_array(self, payload_complexities, system_automation_levels):
+        """
+        Element-wise crew_time_requirements over arrays of inputs.
+
+        Output:
+        - times_with_automation (minutes): ndarray of estimated crew times.
+        """
+        payload_complexities = np.asarray(payload_complexities, dtype=np.float64)
+        system_automation_levels = np.asarray(system_automation_levels, dtype=np.float64)
+
+        # Check if inputs are valid
+        if np.any(payload_complexities < 0):
+            raise ValueError("Payload complexity cannot be negative.")
+        if np.any(~((system_automation_levels >= 0) & (system_automation_levels <= 1))):
+            raise ValueError("System automation level must be between 0 and 1.")
+
+        return _apply_gufunc(_gu_ct, payload_complexities, system_automation_levels)
+
+    def position_location_accuracy_array(self, power_usages, environmental_noises, robot_path_variabilities):
+        """
+        Element-wise position_location_accuracy over arrays of inputs.
+
+        Output:
+        - accuracies (dimensionless): ndarray of normalized accuracy metrics (0 to 1).
+        """
+        power_usages = np.asarray(power_usages, dtype=np.float64)
+        environmental_noises = np.asarray(environmental_noises, dtype=np.float64)
+        robot_path_variabilities = np.asarray(robot_path_variabilities, dtype=np.float64)
+
+        # Check if inputs are valid
+        if np.any(power_usages <= 0):
+            raise ValueError("Power usage must be a positive value.")
+        if np.any(environmental_noises < 0) or np.any(robot_path_variabilities < 0):
+            raise ValueError("Environmental noise and robot path variability cannot be negative.")
+
+        return _apply_gufunc(_gu_pa, power_usages, environmental_noises, robot_path_variabilities)
+
+
+# Shared instance used by the export functions (the model holds no state)
+_MODEL = LunarLogisticsModel()
+
+def _scalar_cache(func):
+    # lru_cache for the scalar exports; 0-d ndarrays are unhashable, so unwrap them first
+    cached = lru_cache(maxsize=4096)(func)
+
+    def unwrap(value):
+        return value.item() if isinstance(value, np.ndarray) and value.ndim == 0 else value
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return cached(*map(unwrap, args), **{k: unwrap(v) for k, v in kwargs.items()})
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+# Export functions for easier direct import. Scalar results are cached for repeated
+# inputs from interactive and script callers; validate_model uses the *_array exports.
+@_scalar_cache
 def predict_payload_maneuverability(payload_mass, robot_power_output, terrain_complexity):
-    model = LunarLogisticsModel()
-    return model.payload_maneuverability(payload_mass, robot_power_output, terrain_complexity)
+    return _MODEL.payload_maneuverability(payload_mass, robot_power_output, terrain_complexity)
 
+@_scalar_cache
 def predict_crew_time(payload_complexity, system_automation_level):
-    model = LunarLogisticsModel()
-    return model.crew_time_requirements(payload_complexity, system_automation_level)
+    return _MODEL.crew_time_requirements(payload_complexity, system_automation_level)
 
+@_scalar_cache
 def predict_position_accuracy(power_usage, environmental_noise, robot_path_variability):
-    model = LunarLogisticsModel()
-    return model.position_location_accuracy(power_usage, environmental_noise, robot_path_variability)
+    return _MODEL.position_location_accuracy(power_usage, environmental_noise, robot_path_variability)
+
+def predict_payload_maneuverability_array(payload_masses, robot_power_outputs, terrain_complexities):
+    return _MODEL.payload_maneuverability_array(payload_masses, robot_power_outputs, terrain_complexities)
+
+def predict_crew_time_array(payload_complexities, system_automation_levels):
+    return _MODEL.crew_time_requirements_array(payload_complexities, system_automation_levels)
+
+def predict_position_accuracy_array(power_usages, environmental_noises, robot_path_variabilities):
+    return _MODEL.position_location_accuracy_array(power_usages, environmental_noises, robot_path_variabilities)
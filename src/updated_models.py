@@ -1,5 +1,7 @@
-import random
+import operator
+
 import numpy as np
+from numba import njit, prange
 
 # -------------------------------------------
 # 1. Effective Throughput Model (Simple Equation)
@@ -14,6 +16,9 @@ def effective_throughput(arrival_rate, power_availability, sensor_accuracy):
     :param power_availability: (float) fraction of the day with adequate power (0–1)
     :param sensor_accuracy: (float) fraction of items correctly identified (0–1)
     :return: (float) effective throughput in items per day
+    
+    All inputs may also be NumPy arrays of broadcast-compatible shapes, in which
+    case the throughput is returned element-wise as an ndarray.
     """
     return arrival_rate * power_availability * sensor_accuracy
 
@@ -25,10 +30,45 @@ def estimate_mission_risk(power_availability, sensor_accuracy, threshold=0.8):
     :param power_availability: (float) fraction of the day with adequate power (0–1)
     :param sensor_accuracy: (float) fraction of items correctly identified (0–1)
     :param threshold: (float) critical threshold below which risk is flagged
-    :return: (bool) True if system is high-risk, False otherwise
+    :return: (numpy.bool_) True if system is high-risk, False otherwise
+    
+    Array inputs broadcast as in effective_throughput and yield a boolean ndarray.
+    Scalar inputs give a numpy.bool_, so test the result with `if risk:` or
+    `risk == True` rather than `risk is True`.
+    """
+    operational_factor = power_availability * sensor_accuracy
+    return np.less(operational_factor, threshold)
+
+
+def throughput_and_risk(arrival_rate, power_availability, sensor_accuracy, threshold=0.8):
+    """
+    Compute effective_throughput and estimate_mission_risk together, sharing the
+    operational factor (power_availability × sensor_accuracy) between them.
+    
+    :param arrival_rate: (float or ndarray) items arriving per day
+    :param power_availability: (float or ndarray) fraction of the day with adequate power (0–1)
+    :param sensor_accuracy: (float or ndarray) fraction of items correctly identified (0–1)
+    :param threshold: (float) critical threshold below which risk is flagged
+    :return: (tuple) effective throughput in items per day, and the high-risk flag
+             (numpy.bool_ for scalar inputs, boolean ndarray for array inputs)
     """
     operational_factor = power_availability * sensor_accuracy
-    return operational_factor < threshold
+    return arrival_rate * operational_factor, np.less(operational_factor, threshold)
+
+
+def sweep_throughput(arrival_rates, power_availabilities, sensor_accuracies):
+    """
+    Evaluate effective_throughput over the full grid of three parameter ranges.
+    
+    :param arrival_rates: (1-D array) arrival rates to sweep (items per day)
+    :param power_availabilities: (1-D array) power availabilities to sweep (0–1)
+    :param sensor_accuracies: (1-D array) sensor accuracies to sweep (0–1)
+    :return: (ndarray) throughput grid of shape (len(arrival_rates), len(power_availabilities), len(sensor_accuracies))
+    """
+    arrival_grid, power_grid, sensor_grid = np.ix_(np.asarray(arrival_rates),
+                                                   np.asarray(power_availabilities),
+                                                   np.asarray(sensor_accuracies))
+    return effective_throughput(arrival_grid, power_grid, sensor_grid)
 
 
 # -------------------------------------------
@@ -49,18 +89,39 @@ def simulate_cargo_flow(arrival_rate, processing_time, delay_probability, simula
     # Convert daily arrival rate to hourly rate
     shipments_per_hour = arrival_rate / 24.0
     total_shipments = np.random.poisson(shipments_per_hour * simulation_time)
-    processed_shipments = 0
-    time_elapsed = 0.0
-
-    for _ in range(total_shipments):
-        # If delayed, processing time doubles
-        actual_processing = processing_time * (2 if random.random() < delay_probability else 1)
-        if time_elapsed + actual_processing <= simulation_time:
-            processed_shipments += 1
-            time_elapsed += actual_processing
-        else:
-            break
-    return processed_shipments
+
+    # If delayed, processing time doubles; shipments are handled back to back,
+    # so the processed count is the number of cumulative finish times within the horizon
+    times = processing_time * (1.0 + (np.random.random(total_shipments) < delay_probability))
+    return int(np.searchsorted(np.cumsum(times), simulation_time, side='right'))
+
+
+def simulate_cargo_flow_batch(arrival_rate, processing_time, delay_probability, simulation_time=24, n_reps=1000):
+    """
+    Run n_reps independent replicates of simulate_cargo_flow at once.
+    Each replicate draws its own Poisson shipment count; processing times of all
+    replicates are sampled as one (n_reps, max_shipments) array and accumulated
+    with a row-wise cumulative sum, so no Python loop runs per shipment.
+    
+    :param arrival_rate: (float) shipments per day
+    :param processing_time: (float) base processing time per shipment (hours)
+    :param delay_probability: (float) chance that a shipment faces delay
+    :param simulation_time: (float) total simulation time in hours (default 24 hours)
+    :param n_reps: (int) number of Monte-Carlo replicates
+    :return: (ndarray of int) number of shipments processed in each replicate
+    """
+    shipments_per_hour = arrival_rate / 24.0
+    total_shipments = np.random.poisson(shipments_per_hour * simulation_time, size=n_reps)
+    max_shipments = int(total_shipments.max()) if n_reps > 0 else 0
+
+    # If delayed, processing time doubles
+    delayed = np.random.random((n_reps, max_shipments)) < delay_probability
+    times = processing_time * (1.0 + delayed)
+    # Slots beyond a replicate's own shipment count never finish in time
+    times[np.arange(max_shipments) >= total_shipments[:, None]] = np.inf
+
+    cumulative_time = np.cumsum(times, axis=1)
+    return np.count_nonzero(cumulative_time <= simulation_time, axis=1)
 
 
 # -------------------------------------------
@@ -79,16 +140,43 @@ def simulate_rover_tasks(num_rovers, rover_speed, task_distance, simulation_time
     """
     # Time to complete one task (in seconds)
     time_per_task = task_distance / rover_speed
-    tasks_completed = 0
-    for _ in range(num_rovers):
-        tasks_completed += simulation_time // time_per_task
-    return int(tasks_completed)
+    # Every rover completes the same number of whole tasks; like range(num_rovers), this
+    # rejects non-integer counts and treats zero or negative counts as no rovers
+    num_rovers = max(operator.index(num_rovers), 0)
+    if num_rovers == 0:
+        return 0
+    return int(num_rovers * (simulation_time // time_per_task))
 
 
 # -------------------------------------------
 # 4. Markov Chain for Power Availability (Simplified)
 # -------------------------------------------
-def simulate_power_availability(mtbf, mttr, simulation_time=720):
+@njit(cache=True)
+def _seed(seed):
+    """Seed Numba's random generator, which is separate from NumPy's global state."""
+    np.random.seed(seed)
+
+
+@njit(cache=True)
+def _sim_power(mtbf, mttr, simulation_time):
+    """Compiled Markov loop behind simulate_power_availability (state 1 = operational, 0 = repair)."""
+    t = 0.0
+    operational_time = 0.0
+    state = 1
+
+    while t < simulation_time:
+        dt = np.random.exponential(mtbf if state else mttr)
+        if state and t + dt > simulation_time:
+            operational_time += simulation_time - t
+            break
+        if state:
+            operational_time += dt
+        t += dt
+        state ^= 1
+    return operational_time / simulation_time
+
+
+def simulate_power_availability(mtbf, mttr, simulation_time=720, seed=None):
     """
     Simulate power system availability using a simple Markov chain.
     The system transitions between 'operational' and 'repair' states.
@@ -96,26 +184,53 @@ def simulate_power_availability(mtbf, mttr, simulation_time=720):
     :param mtbf: (float) Mean Time Between Failures in hours
     :param mttr: (float) Mean Time To Repair in hours
     :param simulation_time: (float) total simulation time in hours (default 720 hours = 30 days)
+    :param seed: (int, optional) seed for a reproducible run; np.random.seed() has no effect here
     :return: (float) fraction of time the power system is operational
     """
-    state = "operational"
-    t = 0.0
-    operational_time = 0.0
+    if seed is not None:
+        if seed < 0:
+            raise ValueError("Seed must be a non-negative integer.")
+        _seed(int(seed))
+    return _sim_power(float(mtbf), float(mttr), float(simulation_time))
 
-    while t < simulation_time:
-        if state == "operational":
-            time_until_failure = np.random.exponential(mtbf)
-            if t + time_until_failure > simulation_time:
-                operational_time += (simulation_time - t)
-                break
-            operational_time += time_until_failure
-            t += time_until_failure
-            state = "repair"
-        else:  # state == "repair"
-            repair_time = np.random.exponential(mttr)
-            t += repair_time
-            state = "operational"
-    return operational_time / simulation_time
+
+@njit(parallel=True, cache=True)
+def _sim_power_batch(mtbf, mttr, simulation_time, n_reps, seeds):
+    availabilities = np.empty(n_reps)
+    for i in prange(n_reps):
+        # Each prange thread has its own RNG state; an empty seeds array leaves those streams unseeded
+        if seeds.shape[0] > 0:
+            np.random.seed(seeds[i])
+        availabilities[i] = _sim_power(mtbf, mttr, simulation_time)
+    return availabilities
+
+
+def simulate_power_availability_batch(mtbf, mttr, simulation_time=720, n_reps=1000, seed=None):
+    """
+    Run n_reps independent replicates of simulate_power_availability in parallel.
+    
+    Replicates draw from Numba's per-thread random streams, so without a seed the
+    results depend on how prange splits the work across threads. With a seed, each
+    replicate reseeds its thread's stream with its own entry of
+    np.random.SeedSequence(seed).generate_state(n_reps) before running. This makes the
+    output reproducible for any thread count, and batches run with different seeds
+    draw independent streams rather than overlapping ones.
+    
+    :param mtbf: (float) Mean Time Between Failures in hours
+    :param mttr: (float) Mean Time To Repair in hours
+    :param simulation_time: (float) total simulation time in hours (default 720 hours = 30 days)
+    :param n_reps: (int) number of Monte-Carlo replicates
+    :param seed: (int, optional) non-negative base seed for a reproducible batch
+    :return: (ndarray) fraction of time the power system is operational in each replicate
+    """
+    if seed is not None and seed < 0:
+        raise ValueError("Seed must be a non-negative integer.")
+    n_reps = int(n_reps)
+    if seed is None:
+        seeds = np.empty(0, dtype=np.uint32)
+    else:
+        seeds = np.random.SeedSequence(int(seed)).generate_state(n_reps)
+    return _sim_power_batch(float(mtbf), float(mttr), float(simulation_time), n_reps, seeds)
 
 
 # -------------------------------------------
@@ -0,0 +1,101 @@
+import math
+import warnings
+
+import numpy as np
+import pytest
+
+from src.lunar_logistics_models import LunarLogisticsModel
+
+NAN = math.nan
+INF = math.inf
+
+MODEL = LunarLogisticsModel()
+
+# (scalar method, array method, input tuples covering valid, boundary and invalid values)
+CASES = [
+    (MODEL.payload_maneuverability, MODEL.payload_maneuverability_array, [
+        (11, 487, 1), (1, 1, 0), (0, 1, 1), (-1, 1, 1), (1, 0, 1), (1, -5, 1),
+        (1, 1, -0.1), (NAN, 1, 1), (1, NAN, 1), (1, 1, NAN), (INF, 1, 1),
+    ]),
+    (MODEL.crew_time_requirements, MODEL.crew_time_requirements_array, [
+        (1, 0.4), (0, 0), (2, 1), (-1, 0.5), (1, -0.01), (1, 1.01),
+        (NAN, 0.5), (1, NAN), (1, INF), (1, -INF),
+    ]),
+    (MODEL.position_location_accuracy, MODEL.position_location_accuracy_array, [
+        (79, 5, 0.1), (1, 0, 0), (0, 1, 1), (-1, 1, 1), (1, -1, 0), (1, 0, -1),
+        (NAN, 1, 1), (1, NAN, 0), (1, 0, NAN),
+    ]),
+]
+
+
+def _rejects(func, *args):
+    try:
+        func(*args)
+    except ValueError:
+        return True
+    return False
+
+
+@pytest.mark.parametrize("scalar_method, array_method, inputs", CASES)
+def test_scalar_and_array_validators_reject_same_inputs(scalar_method, array_method, inputs):
+    valid_row = inputs[0]
+    for args in inputs:
+        expected = _rejects(scalar_method, *args)
+        assert _rejects(array_method, *args) == expected, args
+        # A bad value in any row must reject the whole column
+        columns = [np.array([good, value]) for good, value in zip(valid_row, args)]
+        assert _rejects(array_method, *columns) == expected, args
+
+
+# Plain-Python copies of the original model equations, used as the reference results
+def _reference_pm(payload_mass, robot_power_output, terrain_complexity):
+    return (robot_power_output / (payload_mass * (1 + terrain_complexity))) * 1.05
+
+def _reference_ct(payload_complexity, system_automation_level):
+    return max(0, 15.01 * payload_complexity * (1 - system_automation_level**10.41))
+
+def _reference_pa(power_usage, environmental_noise, robot_path_variability):
+    return max(0, min(1, power_usage / (power_usage + 50 * (1 + environmental_noise + robot_path_variability))))
+
+
+def _random_inputs(n=2000):
+    rng = np.random.default_rng(443)
+    return {
+        "pm": (rng.uniform(0.1, 100, n), rng.uniform(0.1, 1000, n), rng.uniform(0, 3, n)),
+        "ct": (rng.uniform(0, 5, n), rng.uniform(0, 1, n)),
+        "pa": (rng.uniform(0.1, 1000, n), rng.uniform(0, 30, n), rng.uniform(0, 2, n)),
+    }
+
+VALUE_CASES = [
+    ("pm", MODEL.payload_maneuverability, MODEL.payload_maneuverability_array, _reference_pm,
+     [(NAN, 1.0, 1.0), (1.0, 1.0, NAN), (INF, 1.0, 1.0), (1.0, INF, 1.0)]),
+    ("ct", MODEL.crew_time_requirements, MODEL.crew_time_requirements_array, _reference_ct,
+     [(NAN, 0.5), (INF, 0.5), (1.0, 0.0), (1.0, 1.0)]),
+    ("pa", MODEL.position_location_accuracy, MODEL.position_location_accuracy_array, _reference_pa,
+     [(NAN, 1.0, 1.0), (1.0, NAN, 0.0), (INF, 1.0, 1.0), (1.0, 0.0, INF)]),
+]
+
+
+@pytest.mark.parametrize("key, scalar_method, array_method, reference, special_inputs", VALUE_CASES)
+def test_scalar_and_array_methods_match_original_equations(key, scalar_method, array_method, reference,
+                                                           special_inputs):
+    columns = _random_inputs()[key]
+    rows = list(zip(*[c.tolist() for c in columns])) + special_inputs
+
+    expected = np.array([reference(*row) for row in rows], dtype=np.float64)
+    scalar = np.array([scalar_method(*row) for row in rows], dtype=np.float64)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        array = array_method(*[np.array(c, dtype=np.float64) for c in zip(*rows)])
+
+    # Bit-for-bit equality with the original equations, NaN included
+    np.testing.assert_array_equal(scalar, expected)
+    np.testing.assert_array_equal(array, expected)
+
+
+def test_array_methods_broadcast_sweep_axes():
+    masses, powers, terrains = np.ix_([5.0, 10.0], [100.0, 200.0, 300.0], [0.0, 1.0])
+    result = MODEL.payload_maneuverability_array(masses, powers, terrains)
+
+    assert result.shape == (2, 3, 2)
+    assert result[1, 2, 1] == _reference_pm(10.0, 300.0, 1.0)
@@ -0,0 +1,93 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.updated_models import (simulate_cargo_flow, simulate_cargo_flow_batch, simulate_power_availability,
+                                simulate_power_availability_batch, simulate_rover_tasks)
+
+
+def _sequential_cargo_flow(delay_draws, processing_time, delay_probability, simulation_time):
+    # The original shipment-by-shipment rule: stop at the first shipment that would overrun
+    processed_shipments = 0
+    time_elapsed = 0.0
+    for draw in delay_draws:
+        actual_processing = processing_time * (2 if draw < delay_probability else 1)
+        if time_elapsed + actual_processing <= simulation_time:
+            processed_shipments += 1
+            time_elapsed += actual_processing
+        else:
+            break
+    return processed_shipments
+
+
+@pytest.mark.parametrize("arrival_rate, processing_time, delay_probability", [
+    (5, 1.5, 0.10), (40, 1.5, 0.3), (48, 0.5, 0.0), (60, 0.5, 0.5), (30, 4.0, 0.2),
+])
+def test_simulate_cargo_flow_matches_sequential_rule(arrival_rate, processing_time, delay_probability):
+    for seed in range(50):
+        np.random.seed(seed)
+        result = simulate_cargo_flow(arrival_rate, processing_time, delay_probability, simulation_time=24)
+
+        # Replay the same draws through the sequential rule
+        np.random.seed(seed)
+        total_shipments = np.random.poisson(arrival_rate / 24.0 * 24)
+        delay_draws = np.random.random(total_shipments)
+        assert result == _sequential_cargo_flow(delay_draws, processing_time, delay_probability, 24)
+
+
+@pytest.mark.parametrize("arrival_rate, processing_time, delay_probability", [
+    (5, 1.5, 0.10), (40, 1.5, 0.3), (48, 0.5, 0.0),
+])
+def test_simulate_cargo_flow_batch_matches_sequential_rule(arrival_rate, processing_time, delay_probability):
+    n_reps = 200
+    np.random.seed(7)
+    result = simulate_cargo_flow_batch(arrival_rate, processing_time, delay_probability, simulation_time=24,
+                                       n_reps=n_reps)
+
+    np.random.seed(7)
+    total_shipments = np.random.poisson(arrival_rate / 24.0 * 24, size=n_reps)
+    delay_draws = np.random.random((n_reps, int(total_shipments.max())))
+    expected = [_sequential_cargo_flow(delay_draws[i, :total_shipments[i]], processing_time, delay_probability, 24)
+                for i in range(n_reps)]
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("num_rovers", [-2, 0, 1, 2, 7, np.int64(3)])
+def test_simulate_rover_tasks_matches_per_rover_loop(num_rovers):
+    expected = 0
+    for _ in range(num_rovers):
+        expected += 3600 // (100 / 1.0)
+    assert simulate_rover_tasks(num_rovers, 1.0, 100, 3600) == int(expected)
+
+
+def test_simulate_rover_tasks_rejects_fractional_rovers():
+    with pytest.raises(TypeError):
+        simulate_rover_tasks(2.5, 1.0, 100, 3600)
+
+
+def test_simulate_power_availability_propagates_nan_rates():
+    assert math.isnan(simulate_power_availability(float("nan"), 1))
+    assert 0.0 <= simulate_power_availability(100, float("nan")) <= 1.0
+    assert np.isnan(simulate_power_availability_batch(float("nan"), 1, n_reps=8)).all()
+
+
+def test_simulate_power_availability_seed_is_reproducible():
+    first = simulate_power_availability(10, 1, seed=443)
+    assert simulate_power_availability(10, 1, seed=443) == first
+    assert 0.0 <= first <= 1.0
+
+
+def test_simulate_power_availability_batch_seed_is_reproducible_and_independent():
+    batch = simulate_power_availability_batch(10, 1, n_reps=64, seed=0)
+    np.testing.assert_array_equal(simulate_power_availability_batch(10, 1, n_reps=64, seed=0), batch)
+
+    # Nearby seeds must not reuse each other's replicates
+    other = simulate_power_availability_batch(10, 1, n_reps=64, seed=1)
+    assert np.intersect1d(batch, other).size == 0
+
+
+@pytest.mark.parametrize("simulate", [simulate_power_availability, simulate_power_availability_batch])
+def test_simulate_power_availability_rejects_negative_seed(simulate):
+    with pytest.raises(ValueError):
+        simulate(10, 1, seed=-1)
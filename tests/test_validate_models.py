@@ -0,0 +1,73 @@
+import math
+from pathlib import Path
+
+import pytest
+
+from src.lunar_logistics_models import predict_crew_time, predict_payload_maneuverability, predict_position_accuracy
+from validate_models import validate_model
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+VALIDATION_TASKS = [
+    ("payload_maneuverability.csv", predict_payload_maneuverability,
+     ["payload_mass", "robot_power", "terrain_complexity"], "travel_speed"),
+    ("crew_time.csv", predict_crew_time, ["task_complexity", "automation_level"], "crew_time_minutes"),
+    ("position_accuracy.csv", predict_position_accuracy,
+     ["power_usage", "environmental_noise", "path_variability"], "positional_error"),
+]
+
+
+@pytest.mark.parametrize("file_name, prediction_function, input_columns, output_column", VALIDATION_TASKS)
+def test_validate_model_reproduces_committed_outputs(tmp_path, file_name, prediction_function, input_columns,
+                                                     output_column):
+    validate_model(str(REPO_ROOT / "input" / file_name), prediction_function, input_columns, output_column,
+                   output_directory=str(tmp_path))
+
+    assert (tmp_path / file_name).read_bytes() == (REPO_ROOT / "val" / file_name).read_bytes()
+
+
+@pytest.mark.parametrize("file_name, prediction_function, input_columns, output_column", VALIDATION_TASKS)
+def test_validate_model_output_does_not_depend_on_chunking_or_path(tmp_path, file_name, prediction_function,
+                                                                   input_columns, output_column):
+    validation_file = str(REPO_ROOT / "input" / file_name)
+    whole_dir, chunked_dir, row_dir = tmp_path / "whole", tmp_path / "chunked", tmp_path / "row"
+
+    whole_mean = validate_model(validation_file, prediction_function, input_columns, output_column,
+                                output_directory=str(whole_dir))
+    chunked_mean = validate_model(validation_file, prediction_function, tuple(input_columns), output_column,
+                                  output_directory=str(chunked_dir), chunksize=3)
+    # A wrapper has no array counterpart, so it exercises the row-by-row fallback
+    row_mean = validate_model(validation_file, lambda *args: prediction_function(*args), input_columns,
+                              output_column, output_directory=str(row_dir), chunksize=4)
+
+    expected = (whole_dir / file_name).read_bytes()
+    assert (chunked_dir / file_name).read_bytes() == expected
+    assert (row_dir / file_name).read_bytes() == expected
+    assert chunked_mean == pytest.approx(whole_mean)
+    assert row_mean == pytest.approx(whole_mean)
+
+
+def test_validate_model_formats_columns_consistently_across_chunks(tmp_path):
+    validation_file = tmp_path / "crew_time.csv"
+    validation_file.write_text("task_complexity,automation_level,crew_time_minutes\n"
+                               "1,0.1,10\n1,0.2,11\n1,0.3,12\n1,0.4,13\n1,0.5,\n1,0.6,15\n")
+
+    mean_error = validate_model(str(validation_file), predict_crew_time, ["task_complexity", "automation_level"],
+                                "crew_time_minutes", output_directory=str(tmp_path / "out"), chunksize=2)
+
+    lines = (tmp_path / "out" / "crew_time.csv").read_text().splitlines()
+    assert [line.split(",")[2] for line in lines[1:]] == ["10.0", "11.0", "12.0", "13.0", "", "15.0"]
+    assert not math.isnan(mean_error)
+
+
+def test_validate_model_leaves_no_output_when_a_later_chunk_fails(tmp_path):
+    validation_file = tmp_path / "crew_time.csv"
+    validation_file.write_text("task_complexity,automation_level,crew_time_minutes\n"
+                               "1,0.1,10\n1,0.2,11\n1,0.3,12\n1,1.5,13\n")
+    output_directory = tmp_path / "out"
+
+    with pytest.raises(ValueError):
+        validate_model(str(validation_file), predict_crew_time, ["task_complexity", "automation_level"],
+                       "crew_time_minutes", output_directory=str(output_directory), chunksize=2)
+
+    assert list(output_directory.iterdir()) == []
@@ -1,41 +1,91 @@
 import pandas as pd
 import numpy as np
 import os
-from src.lunar_logistics_models import predict_payload_maneuverability, predict_crew_time, predict_position_accuracy
+from src.lunar_logistics_models import (predict_payload_maneuverability, predict_crew_time, predict_position_accuracy,
+                                        predict_payload_maneuverability_array, predict_crew_time_array,
+                                        predict_position_accuracy_array)
 
 def compute_error(predicted, actual):
     """Calculate percentage error between predicted and actual values."""
     return abs(predicted - actual) / actual * 100 if actual != 0 else np.nan
 
-def validate_model(validation_file, prediction_function, input_columns, output_column, output_directory="val/"):
-    # Ensure output directory exists
-    os.makedirs(output_directory, exist_ok=True)
+# Array counterparts of the predictors, evaluated on whole columns at once
+VECTORIZED_PREDICTORS = {
+    predict_payload_maneuverability: predict_payload_maneuverability_array,
+    predict_crew_time: predict_crew_time_array,
+    predict_position_accuracy: predict_position_accuracy_array,
+}
+
+def _predict_chunk(df, prediction_function, vec_func, input_columns, output_column):
+    """Return the predictions and percentage errors for one chunk of validation data."""
+    # Extract each column once as a contiguous float64 array
+    cols = {col: df[col].to_numpy(np.float64) for col in input_columns}
+    actual = df[output_column].to_numpy(np.float64)
+
+    if vec_func is not None:
+        # Evaluate the whole column set in one vectorized call
+        predicted = vec_func(*[cols[col] for col in input_columns])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            errors = np.where(actual != 0, np.abs(predicted - actual) / actual * 100, np.nan)
+        return predicted, errors
 
-    # Load the validation data
-    df = pd.read_csv(validation_file)
+    preds = []
     errors = []
 
-    # Run predictions and compute errors
-    for _, row in df.iterrows():
-        inputs = [row[col] for col in input_columns]
-        predicted = prediction_function(*inputs)
-        actual = row[output_column]
-        error = compute_error(predicted, actual)
-        errors.append(error)
+    # Run predictions and compute errors in a single pass over plain row tuples
+    n_inputs = len(input_columns)
+    for row in df[input_columns + [output_column]].itertuples(index=False, name=None):
+        predicted = prediction_function(*row[:n_inputs])
+        preds.append(predicted)
+        errors.append(compute_error(predicted, row[n_inputs]))
 
-    # Add errors to DataFrame
-    df['Predicted'] = [prediction_function(*[row[col] for col in input_columns]) for _, row in df.iterrows()]
-    df['Error (%)'] = errors
+    return np.asarray(preds, dtype=np.float64), np.asarray(errors, dtype=np.float64)
+
+def validate_model(validation_file, prediction_function, input_columns, output_column, output_directory="val/",
+                   chunksize=100_000):
+    input_columns = list(input_columns)
+
+    # Ensure output directory exists
+    os.makedirs(output_directory, exist_ok=True)
 
     # Construct output file path in the "val" directory
     output_file = os.path.join(output_directory, os.path.basename(validation_file))
-    
-    # Save validation results
-    df.to_csv(output_file, index=False)
+
+    # Stream the validation data in fixed-dtype chunks to bound peak memory; pinning the
+    # model columns to float64 keeps their formatting consistent across chunks
+    dtypes = {col: np.float64 for col in input_columns + [output_column]}
+    chunks = pd.read_csv(validation_file, dtype=dtypes, engine='c', chunksize=chunksize)
+
+    vec_func = VECTORIZED_PREDICTORS.get(prediction_function)
+    error_sum = 0.0
+    error_count = 0
+
+    # Write to a temporary file and only replace the output once every chunk succeeded
+    tmp_file = output_file + ".tmp"
+    try:
+        with open(tmp_file, "w", newline="") as f:
+            for i, df in enumerate(chunks):
+                predicted, errors = _predict_chunk(df, prediction_function, vec_func, input_columns, output_column)
+
+                # Assemble the output frame once from the column arrays and save it
+                out = pd.DataFrame({**{col: df[col].to_numpy() for col in df.columns},
+                                    'Predicted': predicted, 'Error (%)': errors})
+                out.to_csv(f, header=i == 0, index=False)
+
+                # Running totals for the mean error, skipping rows with zero actual value
+                valid = ~np.isnan(errors)
+                error_sum += errors[valid].sum()
+                error_count += np.count_nonzero(valid)
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
     print(f"Validation results saved to {output_file}")
 
     # Summary statistics
-    mean_error = np.nanmean(errors)
+    mean_error = error_sum / error_count if error_count else np.nan
     print(f"Mean Error for {validation_file}: {mean_error:.2f}%\n")
     return mean_error
 